@@ -1,5 +1,7 @@
 import time
+import random
 import logging
+from functools import wraps
 
 logger = logging.getLogger(__name__)
 
@@ -9,65 +11,166 @@ class DeviceNotReadyError(Exception):
 class DeviceTimeoutError(Exception):
     pass
 
+def _requires_ready(fn):
+    """Guards a sensor method on the device being ready"""
+    @wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        if not self.ready:
+            raise DeviceNotReadyError("Device is not ready.")
+        return fn(self, *args, **kwargs)
+    return wrapper
+
 class DeviceController:
-    def __init__(self, hardware_interface):
+    """Generic controller; use for_hardware() to get the sensor-specific subclass"""
+    __slots__ = ("hw", "ready", "status_ttl_ms", "_status_cache", "_device_type")
+
+    def __init__(self, hardware_interface, status_ttl_ms=0):
         self.hw = hardware_interface
         self.ready = False
-        # Determine device type based on class name
-        self.device_type = hardware_interface.__class__.__name__
+        self.status_ttl_ms = status_ttl_ms
+        self._status_cache = (0.0, None)  # (fetched_at, status)
+        self._device_type = None  # looked up on first use
 
-    def boot_device(self, retries=3, timeout=0.1):
-        for i in range(retries):
+    @property
+    def device_type(self):
+        """Device type based on the hardware class name"""
+        if self._device_type is None:
+            self._device_type = self.hw.__class__.__name__
+        return self._device_type
+
+    @classmethod
+    def for_hardware(cls, hardware_interface, **kwargs):
+        """Returns the controller subclass matching the hardware's sensor type"""
+        name = hardware_interface.__class__.__name__
+        if "Motion" in name:
+            return MotionDeviceController(hardware_interface, **kwargs)
+        if "Contact" in name:
+            return ContactDeviceController(hardware_interface, **kwargs)
+        return cls(hardware_interface, **kwargs)
+
+    def boot_device(self, retries=3, base_delay=0.01, max_delay=1.0, jitter=0.5, total_timeout=None):
+        """Boots the device within total_timeout seconds, polling status with truncated exponential backoff and jitter."""
+        if retries <= 0:
+            logger.error("Device failed to boot after all retries")
+            raise DeviceTimeoutError("Device failed to boot within the specified timeout (no retries allowed).")
+        if total_timeout is None:
+            total_timeout = retries * 1.0
+        # Bind everything the poll loop touches to locals once
+        hw_power_on = self.hw.power_on
+        # Only pay for the TTL cache when one is configured
+        poll_status = self._cached_status if self.status_ttl_ms else self.hw.status
+        _mono = time.monotonic
+        _sleep = time.sleep
+        _random = random.random
+        log_checks = logger.isEnabledFor(logging.DEBUG)
+
+        attempt_budget = total_timeout / retries
+        started = _mono()
+        deadline = started + total_timeout
+        attempt = 0
+        attempt_deadline = started  # forces a power-on on the first pass
+        trace = None  # statuses polled during the current attempt, logged once per attempt
+        while True:
+            now = _mono()
+            if now >= deadline:
+                break
             try:
-                logger.info(f"Boot attempt {i+1}")
-                self.hw.power_on()
-                for j in range(10):  # wait up to 1s total per retry
-                    status = self.hw.status()
-                    logger.info(f"Status check {j+1}: {status}")
-                    if status == "READY":
-                        self.ready = True
-                        logger.info(f"Device ready! Type: {self.device_type}")
-                        return
-                    time.sleep(timeout)
+                if now >= attempt_deadline:
+                    if trace:
+                        logger.info("Boot attempt %d polled statuses: %s", attempt, trace)
+                        trace = None
+                    if attempt == retries:
+                        break
+                    attempt += 1
+                    hw_power_on()
+                    self._invalidate_status()
+                    attempt_deadline = min(deadline, now + attempt_budget)
+                    delay = base_delay
+                    trace = []
+                status = poll_status()
+                trace.append(status)
+                if log_checks:
+                    logger.debug("Status check %d: %s", len(trace), status)
+                if status == "READY":
+                    logger.info("Boot attempt %d polled statuses: %s", attempt, trace)
+                    self.ready = True
+                    logger.info("Device ready! Type: %s", self.device_type)
+                    return
+                remaining = attempt_deadline - _mono()
+                if remaining > 0:
+                    _sleep(min(max_delay, remaining, delay * (1 + _random() * jitter)))
+                delay *= 2
             except Exception as e:
-                logger.error(f"Attempt {i+1} failed: {e}")
-        
+                logger.warning("Attempt %d failed: %s (polled statuses: %s)", attempt, e, trace or [])
+                trace = None
+                attempt_deadline = now  # move straight on to the next attempt
+
+        if trace:
+            logger.info("Boot attempt %d polled statuses: %s", attempt, trace)
+        elapsed = _mono() - started
         logger.error("Device failed to boot after all retries")
-        raise DeviceTimeoutError("Device failed to boot within the specified timeout.")
-        
+        raise DeviceTimeoutError(
+            f"Device failed to boot within the specified timeout "
+            f"({elapsed:.2f}s elapsed of {total_timeout:.2f}s, {attempt} attempt(s))."
+        )
+
+    def _cached_status(self):
+        """Returns the hardware status, reusing the last reading if younger than status_ttl_ms."""
+        fetched_at, status = self._status_cache
+        if status is not None and time.monotonic() - fetched_at < self.status_ttl_ms / 1000:
+            return status
+        status = self.hw.status()
+        # Stamp after the query completes so a slow read doesn't shorten the TTL
+        self._status_cache = (time.monotonic(), status)
+        return status
+
+    def _invalidate_status(self):
+        self._status_cache = (0.0, None)
+
     def send_command(self, command):
         """Sends a command to the device."""
         if not self.ready:
             logger.error("Attempted to send command to device that is not ready")
             raise DeviceNotReadyError("Device is not ready.")
-        logger.info(f"Sending command: {command}")
+        logger.info("Sending command: %s", command)
         return self.hw.send(command)
-    
-    def check_motion(self):
-        """Check for motion detection (only for motion sensors)"""
-        if "Motion" not in self.device_type:
-            logger.error("Attempted to check motion on non-motion device")
-            raise TypeError("This device does not support motion detection")
+
+    def send_commands(self, commands):
+        """Sends a batch of commands to the device and returns their responses in order."""
         if not self.ready:
+            logger.error("Attempted to send commands to device that is not ready")
             raise DeviceNotReadyError("Device is not ready.")
-        
+        commands = list(commands)
+        logger.info("Sending %d commands", len(commands))
+        # Hardware that supports it gets the whole batch in one round-trip
+        send_batch = getattr(self.hw, "send_batch", None)
+        if send_batch is not None:
+            return list(send_batch(commands))
+        hw_send = self.hw.send
+        return [hw_send(command) for command in commands]
+
+    def shutdown(self):
+        logger.info("Shutting down device")
+        self.hw.power_off()
+        self._invalidate_status()
+        self.ready = False
+
+class MotionDeviceController(DeviceController):
+    __slots__ = ()
+
+    @_requires_ready
+    def check_motion(self):
+        """Check for motion detection"""
         logger.info("Checking motion status")
         response = self.hw.send("GET_MOTION")
         return response == "MOTION:YES"
-    
+
+class ContactDeviceController(DeviceController):
+    __slots__ = ()
+
+    @_requires_ready
     def check_contact(self):
-        """Check contact state (only for contact sensors)"""
-        if "Contact" not in self.device_type:
-            logger.error("Attempted to check contact on non-contact device")
-            raise TypeError("This device does not support contact sensing")
-        if not self.ready:
-            raise DeviceNotReadyError("Device is not ready.")
-        
+        """Check contact state"""
         logger.info("Checking contact status")
         response = self.hw.send("GET_CONTACT")
-        return response.split(":")[1]  # Returns "OPEN" or "CLOSED"
-
-    def shutdown(self):
-        logger.info("Shutting down device")
-        self.hw.power_off()
-        self.ready = False
\ No newline at end of file
+        return response.partition(":")[2]  # Returns "OPEN" or "CLOSED"
@@ -1,8 +1,33 @@
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import pytest
 
+@pytest.fixture(scope="session", autouse=True)
+def log_listener():
+    # Records are formatted on the logging thread by the QueueHandler, then
+    # written to file and console by the listener thread
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    file_handler = logging.FileHandler("test_log.log", mode="w")
+    stream_handler = logging.StreamHandler()  # This will also print to console
+    listener = QueueListener(log_queue, file_handler, stream_handler)
+
+    root = logging.getLogger()
+    old_level = root.level
+    root.setLevel(logging.INFO)
+    root.addHandler(queue_handler)
+    listener.start()
+    yield listener
+    listener.stop()
+    root.removeHandler(queue_handler)
+    root.setLevel(old_level)
+    file_handler.close()
+
 @pytest.fixture(scope="session")
 def global_data():
     # Setup that runs once for the entire test session
     data = {"config": "test_settings"}
     yield data
-    # Teardown code goes here
\ No newline at end of file
+    # Teardown code goes here
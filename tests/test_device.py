@@ -1,24 +1,22 @@
 import sys
 import os
+import time
+import random
 import logging
+from collections import deque
+from functools import lru_cache
 import pytest
-from src.device import DeviceController, DeviceNotReadyError, DeviceTimeoutError
+from src.device import (DeviceController, MotionDeviceController, ContactDeviceController,
+                        DeviceNotReadyError, DeviceTimeoutError)
 from abc import ABC, abstractmethod
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
 
-# Configure logging at the module level
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("test_log.log", mode="w"),
-        logging.StreamHandler()  # This will also print to console
-    ]
-)
-
+# Logging is routed to test_log.log and the console by the log_listener fixture in conftest.py
 logger = logging.getLogger(__name__)
 
 class AbstractHardware(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def power_on(self):
         pass
@@ -37,21 +35,27 @@ class AbstractHardware(ABC):
 
 
 # --- Fixture for default fake hardware (ready instantly) ---
-@pytest.fixture
+# Built once per module; reset_fake_hw restores their state before each test
+@pytest.fixture(scope="module")
 def fake_motionsensor_hw():
     return FakeMotionSensor()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def fake_contactsensor_hw():
     return FakeContactSensor()
 
+@pytest.fixture(autouse=True)
+def reset_fake_hw(fake_motionsensor_hw, fake_contactsensor_hw):
+    fake_motionsensor_hw.reset()
+    fake_contactsensor_hw.reset()
+
 # --- Fixture for a controller with instantly ready hardware ---
 @pytest.fixture(params=["motion","contact"])
 def device_controller(request, fake_motionsensor_hw, fake_contactsensor_hw):
     if request.param == "motion":
-        return DeviceController(fake_motionsensor_hw)
+        return DeviceController.for_hardware(fake_motionsensor_hw)
     elif request.param == "contact":
-        return DeviceController(fake_contactsensor_hw)
+        return DeviceController.for_hardware(fake_contactsensor_hw)
     else:
         raise ValueError("Invalid device type")
 
@@ -68,9 +72,9 @@ def delayed_contact_hw():
 @pytest.fixture(params=["motion","contact"])
 def delayed_device_controller(request, delayed_motion_hw, delayed_contact_hw):
     if request.param == "motion":
-        return DeviceController(delayed_motion_hw)
+        return DeviceController.for_hardware(delayed_motion_hw)
     elif request.param == "contact":
-        return DeviceController(delayed_contact_hw)
+        return DeviceController.for_hardware(delayed_contact_hw)
     else:
         raise ValueError("Invalid device type")
 
@@ -87,89 +91,141 @@ def failing_contact_hw():
 @pytest.fixture(params=["motion","contact"])
 def failing_device_controller(request, failing_motion_hw, failing_contact_hw):
     if request.param == "motion":
-        return DeviceController(failing_motion_hw)
+        return DeviceController.for_hardware(failing_motion_hw)
     elif request.param == "contact":
-        return DeviceController(failing_contact_hw)
+        return DeviceController.for_hardware(failing_contact_hw)
     else:
         raise ValueError("Invalid device type")
 
+# --- Fixture for a virtual clock: time.sleep advances time.monotonic instantly ---
+@pytest.fixture
+def fake_clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(time, "sleep", clock.sleep)
+    return clock
+
 ##############################################################################################################
 
+class FakeClock:
+    """Monotonic clock that only moves when sleep() is called, recording each sleep"""
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+# Most recent commands kept by each fake sensor
+COMMAND_HISTORY = 4096
+
+@lru_cache(maxsize=256)
+def _ack(cmd):
+    """Interned ACK response, built once per distinct command"""
+    return sys.intern("ACK:" + cmd)
+
 class FakeMotionSensor(AbstractHardware):
+    __slots__ = ("_power", "_ready_counter", "_ready_after", "_is_ready", "commands",
+                 "_motion_detected", "_handlers")
+
     def __init__(self, ready_after=0):
-        self._power = False
-        self._ready_counter = 0
         self._ready_after = ready_after
-        self.commands = []
-        self._motion_detected = False
+        self.commands = deque(maxlen=COMMAND_HISTORY)
+        self._handlers = {"GET_MOTION": self._handle_get_motion}
+        self.reset()
 
     def power_on(self):
         self._power = True
         self._ready_counter += 1
+        self._is_ready = self._ready_counter > self._ready_after
 
     def power_off(self):
         self._power = False
 
     def status(self):
-        if self._ready_counter > self._ready_after:
-            return "READY"
-        return "BOOTING"
+        return "READY" if self._is_ready else "BOOTING"
     
     def send(self, cmd):
         if not self._power:
             raise DeviceNotReadyError("Device is not powered on")
-        if self._ready_counter <= self._ready_after:
+        if not self._is_ready:
             raise DeviceTimeoutError("Device is not ready")
         self.commands.append(cmd)
-        
+
         # Special commands processing
-        if cmd == "GET_MOTION":
-            return "MOTION:YES" if self._motion_detected else "MOTION:NO"
-        
-        return f"ACK:{cmd}"
+        handler = self._handlers.get(cmd)
+        return handler() if handler else _ack(cmd)
+
+    def _handle_get_motion(self):
+        return "MOTION:YES" if self._motion_detected else "MOTION:NO"
     
+    def reset(self):
+        """Set the mutable state to its initial values (also used by __init__)"""
+        self._power = False
+        self._ready_counter = 0
+        self._is_ready = False  # sticky: once READY, always READY
+        self.commands.clear()
+        self._motion_detected = False
+
     def set_motion_detected(self, detected=True):
         """Set the motion detection state for testing"""
         self._motion_detected = detected
 
 class FakeContactSensor(AbstractHardware):
+    __slots__ = ("_power", "_ready_counter", "_ready_after", "_is_ready", "commands",
+                 "_contact_state", "_contact_responses", "_contact_response", "_handlers")
+
     def __init__(self, ready_after=0):
-        self._power = False
-        self._ready_counter = 0
         self._ready_after = ready_after
-        self.commands = []
-        self._contact_state = "CLOSED"  # Default state is closed
+        self.commands = deque(maxlen=COMMAND_HISTORY)
+        self._contact_responses = {"OPEN": "CONTACT:OPEN", "CLOSED": "CONTACT:CLOSED"}
+        self._handlers = {"GET_CONTACT": self._handle_get_contact}
+        self.reset()
 
     def power_on(self):
         self._power = True
         self._ready_counter += 1
+        self._is_ready = self._ready_counter > self._ready_after
 
     def power_off(self):
         self._power = False
 
     def status(self):
-        if self._ready_counter > self._ready_after:
-            return "READY"
-        return "BOOTING"
+        return "READY" if self._is_ready else "BOOTING"
     
     def send(self, cmd):
         if not self._power:
             raise DeviceNotReadyError("Device is not powered on")
-        if self._ready_counter <= self._ready_after:
+        if not self._is_ready:
             raise DeviceTimeoutError("Device is not ready")
         self.commands.append(cmd)
-        
+
         # Special commands processing
-        if cmd == "GET_CONTACT":
-            return f"CONTACT:{self._contact_state}"
-        
-        return f"ACK:{cmd}"
+        handler = self._handlers.get(cmd)
+        return handler() if handler else _ack(cmd)
+
+    def _handle_get_contact(self):
+        return self._contact_response
     
+    def reset(self):
+        """Set the mutable state to its initial values (also used by __init__)"""
+        self._power = False
+        self._ready_counter = 0
+        self._is_ready = False  # sticky: once READY, always READY
+        self.commands.clear()
+        self._contact_state = "CLOSED"  # Default state is closed
+        self._contact_response = self._contact_responses["CLOSED"]
+
     def set_contact_state(self, state):
         """Set the contact sensor state for testing. State should be 'OPEN' or 'CLOSED'"""
         if state not in ["OPEN", "CLOSED"]:
             raise ValueError("Contact state must be either 'OPEN' or 'CLOSED'")
         self._contact_state = state
+        self._contact_response = self._contact_responses[state]
 
 ##############################################################################################################       
 
@@ -188,6 +244,59 @@ def test_device_fails_to_boot(failing_device_controller):
     with pytest.raises(DeviceTimeoutError):
         failing_device_controller.boot_device()
 
+@pytest.mark.parametrize("rand, expected_sleeps", [
+    (0.0, [1.0, 2.0, 4.0, 3.0]),    # no jitter: delay doubles, capped at max_delay, then at remaining time
+    (0.5, [1.25, 2.5, 4.0, 2.25]),  # mid-range jitter stretches each delay by 25%
+    (1.0, [1.5, 3.0, 4.0, 1.5]),    # maximum jitter: delay * (1 + jitter)
+])
+def test_boot_polls_with_exponential_backoff(failing_motion_hw, fake_clock, monkeypatch, rand, expected_sleeps):
+    logger.info("Test boot polling backs off exponentially...")
+    poll_times = []
+    real_status = FakeMotionSensor.status
+    monkeypatch.setattr(FakeMotionSensor, "status", lambda self: poll_times.append(fake_clock.now) or real_status(self))
+    monkeypatch.setattr(random, "random", lambda: rand)
+    controller = DeviceController(failing_motion_hw)
+    with pytest.raises(DeviceTimeoutError):
+        controller.boot_device(retries=1, base_delay=1.0, max_delay=4.0, jitter=0.5, total_timeout=10.0)
+    assert fake_clock.sleeps == expected_sleeps
+    # The first poll is immediate and each later poll follows a sleep
+    assert poll_times[0] == 0.0
+    assert len(poll_times) == len(expected_sleeps)
+
+def test_boot_respects_total_timeout(failing_device_controller, fake_clock):
+    logger.info("Test boot gives up at the total timeout...")
+    with pytest.raises(DeviceTimeoutError, match=r"3 attempt\(s\)"):
+        failing_device_controller.boot_device(retries=3, total_timeout=0.3)
+    assert failing_device_controller.hw._ready_counter == 3
+    assert fake_clock.now == pytest.approx(0.3)
+
+@pytest.mark.parametrize("retries", [0, -1])
+def test_boot_without_retries_times_out(device_controller, retries):
+    logger.info("Test boot with no retries allowed...")
+    with pytest.raises(DeviceTimeoutError):
+        device_controller.boot_device(retries=retries)
+    assert not device_controller.ready
+
+def test_status_cached_within_ttl(failing_motion_hw, monkeypatch):
+    logger.info("Test status reads are cached within the TTL...")
+    calls = []
+    real_status = FakeMotionSensor.status
+    monkeypatch.setattr(FakeMotionSensor, "status", lambda self: calls.append(1) or real_status(self))
+    controller = DeviceController(failing_motion_hw, status_ttl_ms=10_000)
+    with pytest.raises(DeviceTimeoutError):
+        controller.boot_device(retries=2, total_timeout=0.2)
+    # One hardware read per power-on; every other poll is served from the cache
+    assert len(calls) == 2
+
+def test_status_uncached_without_ttl(failing_motion_hw, fake_clock, monkeypatch):
+    logger.info("Test status reads bypass the cache when no TTL is set...")
+    cached_calls = []
+    monkeypatch.setattr(DeviceController, "_cached_status", lambda self: cached_calls.append(1) or "BOOTING")
+    controller = DeviceController(failing_motion_hw)
+    with pytest.raises(DeviceTimeoutError):
+        controller.boot_device(retries=1)
+    assert cached_calls == []
+
 def test_command_before_boot(device_controller):
     logger.info("Test command before boot...")
     with pytest.raises(DeviceNotReadyError):
@@ -200,16 +309,43 @@ def test_successful_command_after_boot(device_controller):
     assert resp == "ACK:PING"
     assert device_controller.ready
 
+def test_send_commands_batch(device_controller):
+    logger.info("Test sending a batch of commands...")
+    with pytest.raises(DeviceNotReadyError):
+        device_controller.send_commands(["PING"])
+    device_controller.boot_device()
+    resp = device_controller.send_commands(iter(["PING", "RESET"]))
+    assert resp == ["ACK:PING", "ACK:RESET"]
+    assert list(device_controller.hw.commands) == ["PING", "RESET"]
+
+def test_send_commands_uses_hardware_batch(device_controller, monkeypatch):
+    logger.info("Test batch delivery through hardware send_batch...")
+    batches = []
+    monkeypatch.setattr(type(device_controller.hw), "send_batch",
+                        lambda self, cmds: batches.append(cmds) or ["OK"] * len(cmds), raising=False)
+    device_controller.boot_device()
+    assert device_controller.send_commands(["PING", "RESET"]) == ["OK", "OK"]
+    assert batches == [["PING", "RESET"]]
+
+def test_for_hardware_falls_back_to_calling_class():
+    logger.info("Test for_hardware keeps the caller's class for generic hardware...")
+    class CustomController(DeviceController):
+        __slots__ = ()
+    controller = CustomController.for_hardware(object())
+    assert type(controller) is CustomController
+    assert not hasattr(controller, "check_motion")
+
 # --- Motion Sensor Specific Tests ---
 
 @pytest.fixture
 def motion_controller(fake_motionsensor_hw):
-    controller = DeviceController(fake_motionsensor_hw)
+    controller = DeviceController.for_hardware(fake_motionsensor_hw)
     controller.boot_device()
     return controller
 
 def test_motion_detection(motion_controller, fake_motionsensor_hw):
     logger.info("Testing motion detection...")
+    assert isinstance(motion_controller, MotionDeviceController)
     
     # No motion initially
     assert not motion_controller.check_motion()
@@ -225,21 +361,22 @@ def test_motion_detection(motion_controller, fake_motionsensor_hw):
 def test_motion_detection_type_error(device_controller):
     # This only runs with contact sensors (due to parametrization in device_controller fixture)
     if "Contact" in device_controller.device_type:
-        logger.info("Testing motion detection type error on contact sensor...")
+        logger.info("Testing motion detection is unavailable on contact sensor...")
         device_controller.boot_device()
-        with pytest.raises(TypeError):
+        with pytest.raises(AttributeError):
             device_controller.check_motion()
 
 # --- Contact Sensor Specific Tests ---
 
 @pytest.fixture
 def contact_controller(fake_contactsensor_hw):
-    controller = DeviceController(fake_contactsensor_hw)
+    controller = DeviceController.for_hardware(fake_contactsensor_hw)
     controller.boot_device()
     return controller
 
 def test_contact_sensing(contact_controller, fake_contactsensor_hw):
     logger.info("Testing contact sensing...")
+    assert isinstance(contact_controller, ContactDeviceController)
     
     # Default state is CLOSED
     assert contact_controller.check_contact() == "CLOSED"
@@ -255,9 +392,9 @@ def test_contact_sensing(contact_controller, fake_contactsensor_hw):
 def test_contact_sensing_type_error(device_controller):
     # This only runs with motion sensors (due to parametrization in device_controller fixture)
     if "Motion" in device_controller.device_type:
-        logger.info("Testing contact sensing type error on motion sensor...")
+        logger.info("Testing contact sensing is unavailable on motion sensor...")
         device_controller.boot_device()
-        with pytest.raises(TypeError):
+        with pytest.raises(AttributeError):
             device_controller.check_contact()
 
 def test_contact_invalid_state(contact_controller, fake_contactsensor_hw):